@@ -7,26 +7,127 @@ import itertools
 import math
 import random
 import sys
+from dataclasses import replace
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFilter
+
+# Resampling filters moved in Pillow 9.1; pillow-simd tracks older Pillow
+try:
+    LANCZOS = Image.Resampling.LANCZOS
+except AttributeError:
+    LANCZOS = Image.LANCZOS
+
 from . import store
 from .fractals import Fractals
 from .tortoise import Tortoise
 
+try:
+    from . import fractal_kernels
+except ImportError:  # numba is optional
+    fractal_kernels = None
+
 
 def create_l_system(iters, axiom, rules) -> str:
     """Build the complete L-System sequence"""
     if iters == 0:
         return axiom
 
-    end_string = ""
-    start_string = axiom
+    # The symbols are all single ASCII characters, so work on bytes with a
+    # 256-entry substitution table (identity for unmapped symbols). Each
+    # expansion step is then a single C-level join instead of a
+    # per-character Python loop - a big win for deep iterations.
+    table = [bytes([b]) for b in range(256)]
+    for symbol, replacement in rules.items():
+        table[ord(symbol)] = replacement.encode("ascii")
 
+    sequence = axiom.encode("ascii")
     for _ in range(iters):
-        end_string = "".join(rules[i] if i in rules else i for i in start_string)
-        start_string = end_string
+        sequence = b"".join([table[b] for b in sequence])
+
+    return sequence.decode("ascii")
+
+
+def expand(rules, symbols, depth):
+    """Expand an L-System lazily, yielding terminal symbols one at a time
+
+    Unlike create_l_system, nothing is materialized: peak memory is
+    O(depth), not O(len(final string)) - which reaches tens of MB for deep
+    fractals.
+    """
+    if depth == 0:
+        yield from symbols
+        return
+
+    for c in symbols:
+        if c in rules:
+            yield from expand(rules, rules[c], depth - 1)
+        else:
+            yield c
+
+
+@lru_cache(maxsize=32)
+def _expand_cached(axiom, rules_items, iters) -> str:
+    """Cached L-System expansion - Fractals.* are immutable constants, so
+    repeated draws of the same fractal can share one expansion"""
+    return create_l_system(iters, axiom, dict(rules_items))
+
+
+def _mat_mul(a, b):
+    """Multiply two small square matrices (lists of rows)"""
+    cols = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, col)) for col in cols] for row in a]
+
+
+def _mat_pow(m, n):
+    """Raise a small square matrix to the n'th power by repeated squaring"""
+    size = len(m)
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    while n:
+        if n & 1:
+            result = _mat_mul(result, m)
+        m = _mat_mul(m, m)
+        n >>= 1
+    return result
 
-    return end_string
+
+def expansion_counts(iters, axiom, rules) -> dict:
+    """Count each symbol in the expanded L-System without building it
+
+    One substitution step is linear over symbol counts, so the counts after
+    N iterations are the axiom's count vector times the N'th power of the
+    rule transition matrix. Repeated squaring makes this O(log N) small
+    matrix multiplies - no exponentially-long string required.
+    """
+    symbols = sorted(
+        set(axiom) | set(rules) | {c for rule in rules.values() for c in rule}
+    )
+    index = {s: i for i, s in enumerate(symbols)}
+
+    # transition[i][j]: copies of symbol j produced by one symbol i per step
+    transition = [[0] * len(symbols) for _ in symbols]
+    for i, s in enumerate(symbols):
+        for c in rules.get(s, s):
+            transition[i][index[c]] += 1
+
+    power = _mat_pow(transition, iters)
+    final = [0] * len(symbols)
+    for c in axiom:
+        for j, count in enumerate(power[index[c]]):
+            final[j] += count
+
+    return dict(zip(symbols, final))
+
+
+def expansion_length(iters, axiom, rules) -> int:
+    """Length of the expanded L-System, without building it
+
+    Like expand(), kept as the memory-light alternative: together they feed
+    draw_l_system (which needs the length for its colour period) without
+    ever materializing the sequence. draw_fractal itself uses the cached
+    materialized expansion, which wins once the string is cached anyway.
+    """
+    return sum(expansion_counts(iters, axiom, rules).values())
 
 
 # Generate some colours
@@ -37,15 +138,22 @@ COLOURS_HSV = list((x, SAT, VAL) for x in range(0, 360, int(360 / NUM_COLOURS)))
 
 
 def draw_l_system(
-    t: Tortoise, instructions: str, angle: Tortoise.Degrees, distance: float
+    t: Tortoise,
+    instructions,
+    angle: Tortoise.Degrees,
+    distance: float,
+    length: int = None,
 ):
-    """Draw the L-System"""
+    """Draw the L-System (instructions: any iterable of symbols)"""
     colours = itertools.cycle(COLOURS_HSV)
-    colour_period = math.ceil(len(instructions) / NUM_COLOURS)
+    if length is None:
+        length = len(instructions)
+    colour_period = math.ceil(length / NUM_COLOURS)
 
     for step, cmd in enumerate(instructions):
-        # cycle through colours
+        # cycle through colours, flushing buffered lines in the old colour
         if (step % colour_period) == 0:
+            t.flush()
             t.colour = next(colours)
 
         if cmd == "F":
@@ -55,24 +163,41 @@ def draw_l_system(
         elif cmd == "-":
             t.left(angle)
 
+    t.flush()
+
 
 def draw_fractal(fractal, linewidth=2, margin=20) -> Image:
     """Draw a Fractal"""
-    descr = create_l_system(fractal.iterations, fractal.axiom, fractal.rules)
-
-    # Walk the fractal once without drawing it, so we can get dimensions
-    t = Tortoise(None, None, angle=0)
-    t.pen_down = False
-    draw_l_system(t, descr, fractal.angle, fractal.size)
+    # The expansion is cached: drawing the same fractal again (or walking it
+    # twice below) reuses one string. expand() remains the lighter choice
+    # when memory matters more than repeat-call speed.
+    descr = _expand_cached(
+        fractal.axiom, tuple(sorted(fractal.rules.items())), fractal.iterations
+    )
+    length = len(descr)
+
+    # Walk the fractal once without drawing it, so we can get dimensions.
+    # With Numba available this is a compiled kernel; otherwise walk in Python
+    if fractal_kernels is not None:
+        min_x, min_y, max_x, max_y = fractal_kernels.walk_bounds(
+            fractal.rules, fractal.axiom, fractal.iterations, fractal.angle, fractal.size
+        )
+    else:
+        t = Tortoise(None, None, angle=0)
+        t.pen_down = False
+        draw_l_system(t, descr, fractal.angle, fractal.size, length)
+        min_x, min_y, max_x, max_y = t.min_x, t.min_y, t.max_x, t.max_y
 
     # Calculate the required image dimensions and pen offset
-    final_width = int((abs(t.max_x) + abs(t.min_x)) + margin)
-    final_height = int((abs(t.max_y) + abs(t.min_y)) + margin)
-    start_x = abs(t.min_x) + margin / 2
-    start_y = abs(t.min_y) + margin / 2
-
-    # Oversample to reduce anti-aliasing and make things look nicer
-    oversampling = 10
+    final_width = int((abs(max_x) + abs(min_x)) + margin)
+    final_height = int((abs(max_y) + abs(min_y)) + margin)
+    start_x = abs(min_x) + margin / 2
+    start_y = abs(min_y) + margin / 2
+
+    # Oversample to reduce anti-aliasing and make things look nicer. 2x
+    # supersampling plus rounded line joints and a Lanczos downscale looks
+    # close to the old 10x version, but the backing buffer is 25x smaller.
+    oversampling = 2
     width = int(final_width * oversampling)
     height = int(final_height * oversampling)
 
@@ -88,11 +213,11 @@ def draw_fractal(fractal, linewidth=2, margin=20) -> Image:
         angle=0,
         width=linewidth * oversampling,
     )
-    draw_l_system(t, descr, fractal.angle, fractal.size * oversampling)
+    draw_l_system(t, descr, fractal.angle, fractal.size * oversampling, length)
 
     # Scale back down
     # Filters: https://pillow.readthedocs.io/en/stable/handbook/concepts.html#filters
-    im = im.resize((final_width, final_height), resample=Image.LANCZOS)
+    im = im.resize((final_width, final_height), resample=LANCZOS)
     im = im.filter(ImageFilter.SMOOTH)
     im = im.convert("RGB")
     return im
@@ -119,8 +244,8 @@ def save_fractal_to_file(fractal_name: str, size, dirname=".") -> str:
     Returns path of saved file
     """
     dest = f"{fractal_name}_{size}.png"
-    fractal = getattr(Fractals, fractal_name)
-    fractal.size = size
+    # Params is frozen - make a copy with the requested size
+    fractal = replace(getattr(Fractals, fractal_name), size=size)
     im = draw_fractal(fractal)
     full_dest = dirname + "/" + dest
     im.save(full_dest)
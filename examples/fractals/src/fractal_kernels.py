@@ -0,0 +1,101 @@
+"""Numba-compiled kernels for L-System expansion and the turtle walk
+
+Numba is optional - importing this module raises ImportError without it, and
+draw.py falls back to the pure-Python walk.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+# Symbols with geometric meaning (see draw.draw_l_system)
+_FORWARD = ord("F")
+_RIGHT = ord("+")
+_LEFT = ord("-")
+
+
+@njit(cache=True)
+def _expand(symbols, rule_starts, rule_lens, rule_data, iters):
+    """Expand uint8 symbols through a flattened (CSR-style) rule table"""
+    current = symbols
+    for _ in range(iters):
+        total = 0
+        for b in current:
+            total += rule_lens[b]
+        out = np.empty(total, np.uint8)
+        i = 0
+        for b in current:
+            start = rule_starts[b]
+            length = rule_lens[b]
+            out[i : i + length] = rule_data[start : start + length]
+            i += length
+        current = out
+    return current
+
+
+@njit(cache=True)
+def _walk_bounds(symbols, turn, dist, cos_tab, sin_tab):
+    """Walk the symbols and return the turtle's bounding box
+
+    The heading is an integer angle indexing precomputed cos/sin tables -
+    composing rotations instead would drift relative to the Tortoise walk,
+    and the bounds must be bit-identical so the image size doesn't depend
+    on whether numba is installed.
+    """
+    pos_x = pos_y = 0.0
+    angle = 0
+    min_x = min_y = max_x = max_y = 0.0
+
+    for b in symbols:
+        if b == _FORWARD:
+            pos_x += dist * cos_tab[angle]
+            pos_y += dist * sin_tab[angle]
+            if pos_x > max_x:
+                max_x = pos_x
+            if pos_y > max_y:
+                max_y = pos_y
+            if pos_x < min_x:
+                min_x = pos_x
+            if pos_y < min_y:
+                min_y = pos_y
+        elif b == _RIGHT:
+            angle = (angle + turn) % 360
+        elif b == _LEFT:
+            angle = angle - turn
+            if angle < 0:
+                angle += 360
+
+    return min_x, min_y, max_x, max_y
+
+
+def _flatten_rules(rules):
+    """Flatten the rule dict into a 256-entry (starts, lens, data) table"""
+    starts = np.zeros(256, np.int64)
+    lens = np.zeros(256, np.int64)
+    chunks = []
+    offset = 0
+    for b in range(256):
+        replacement = rules.get(chr(b), chr(b)).encode("latin-1")
+        starts[b] = offset
+        lens[b] = len(replacement)
+        chunks.append(replacement)
+        offset += len(replacement)
+    data = np.frombuffer(b"".join(chunks), np.uint8)
+    return starts, lens, data
+
+
+def walk_bounds(rules, axiom, iters, turn, dist):
+    """Bounding box of the L-System walk, entirely in compiled code
+
+    Returns (min_x, min_y, max_x, max_y).
+    """
+    starts, lens, data = _flatten_rules(rules)
+    axiom_arr = np.frombuffer(axiom.encode("ascii"), np.uint8)
+    symbols = _expand(axiom_arr, starts, lens, data, iters)
+    # One entry per whole degree - every fractal's turn angle divides 360.
+    # Built with the same math calls as tortoise._direction, so the kernel
+    # sees exactly the values the Python walk would use.
+    cos_tab = np.array([math.cos(math.radians(a)) for a in range(360)])
+    sin_tab = np.array([math.sin(math.radians(a)) for a in range(360)])
+    return _walk_bounds(symbols, int(turn), dist, cos_tab, sin_tab)
@@ -5,9 +5,13 @@ Credit: https://elc.github.io/posts/plotting-fractals-step-by-step-with-python
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Params:
-    """Holds Fractal definitions suitable for L-System construction"""
+    """Holds Fractal definitions suitable for L-System construction
+
+    Frozen: definitions are shared module-level constants, and the expansion
+    cache relies on them not changing. Use dataclasses.replace to vary one.
+    """
 
     name: str
     axiom: str
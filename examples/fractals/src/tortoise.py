@@ -6,6 +6,21 @@ from dataclasses import dataclass
 
 from PIL import Image, ImageDraw
 
+# Unit direction vectors for angles already seen, keyed on degrees. Each
+# fractal only ever uses a single turn angle (which evenly divides 360), so
+# this stays tiny and saves two libm calls per step.
+_DIRECTIONS = {}
+
+
+def _direction(angle):
+    """Get the (x, y) unit vector for a heading of ANGLE degrees"""
+    try:
+        return _DIRECTIONS[angle]
+    except KeyError:
+        rad = math.radians(angle)
+        direction = _DIRECTIONS[angle] = (math.cos(rad), math.sin(rad))
+        return direction
+
 
 @dataclass
 class Tortoise:
@@ -25,6 +40,10 @@ class Tortoise:
     min_x: int = 0
     min_y: int = 0
 
+    def __post_init__(self):
+        self.dir_x, self.dir_y = _direction(self.angle)
+        self._points = [(self.pos_x, self.pos_y)]
+
     def _update_limits(self):
         """Update the max and min positions with the current state"""
         if self.pos_x > self.max_x:
@@ -38,25 +57,35 @@ class Tortoise:
 
     def forward(self, dist):
         """Move forward by dist, drawing a line in the process"""
-        start = (self.pos_x, self.pos_y)
-        self.pos_x += dist * math.cos(math.radians(self.angle))
-        self.pos_y += dist * math.sin(math.radians(self.angle))
+        self.pos_x += dist * self.dir_x
+        self.pos_y += dist * self.dir_y
         self._update_limits()
-        end = (self.pos_x, self.pos_y)
         if self.pen_down:
-            self.draw.line([start, end], fill=self.colour, width=self.width)
+            self._points.append((self.pos_x, self.pos_y))
+
+    def flush(self):
+        """Draw the buffered points as a single polyline
+
+        Buffering successive positions and drawing them in one call (per pen
+        colour) is much cheaper than one draw call per step.
+        """
+        if self.pen_down and len(self._points) > 1:
+            self.draw.line(
+                self._points, fill=self.colour, width=self.width, joint="curve"
+            )
+        self._points = [(self.pos_x, self.pos_y)]
 
     def right(self, angle: Degrees):
         """Turn left by ANGLE degrees"""
-        prev = self.angle
         self.angle = (self.angle + angle) % 360.0
+        self.dir_x, self.dir_y = _direction(self.angle)
 
     def left(self, angle: Degrees):
         """Turn left by ANGLE degrees"""
-        prev = self.angle
         self.angle = self.angle - angle
         if self.angle < 0:
             self.angle += 360.0
+        self.dir_x, self.dir_y = _direction(self.angle)
 
 
 def test_tortoise(width=200, height=200):
@@ -70,4 +99,5 @@ def test_tortoise(width=200, height=200):
     t.forward(100)
     t.left(90)
     t.forward(50)
+    t.flush()
     im.save(sys.stdout.buffer, "PNG")
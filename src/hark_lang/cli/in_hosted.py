@@ -5,6 +5,7 @@ import logging
 import os
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..cloud import aws
@@ -58,14 +59,17 @@ def deploy(config: Config, instance_api):
     # 2. Compute the hashes
     with ui.spin("Building source package") as sp:
         python_zip = config.project.data_dir / "python.zip"
-        make_python_layer_zip(config, python_zip)
+        # the zip is hashed as it is written - no second read of a
+        # potentially large file
+        python_hash = make_python_layer_zip(config, python_zip)
         sp.ok(ui.TICK)
 
     # 3. Request a new package with the hashes
     with ui.spin("Checking for differences ") as sp:
-        python_hash = aws.hash_file(python_zip)
-        hark_hash = aws.hash_file(config.project.hark_file)
-        config_hash = aws.hash_file(config.config_file)
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            hark_hash, config_hash = ex.map(
+                aws.hash_file, [config.project.hark_file, config.config_file]
+            )
         package = q.new_package(instance.id, python_hash, hark_hash, config_hash)
         changed = {
             "Python": package.new_python,
@@ -80,21 +84,29 @@ def deploy(config: Config, instance_api):
         )
         sp.ok(ui.TICK)
 
-    # 4. Upload the files that have changed
+    # 4. Upload the files that have changed, overlapping the (I/O bound)
+    # transfers. Spinner updates stay on this thread.
+    uploads = []
     if package.new_python:
-        with ui.spin("Uploading new Python ") as sp:
-            instance_api.upload_file(package.python_url, python_zip)
-            sp.text += ui.dim(python_hash)
-            sp.ok(ui.TICK)
+        uploads.append(("Python", package.python_url, python_zip))
     if package.new_hark:
-        with ui.spin("Uploading new Hark ") as sp:
-            instance_api.upload_file(package.hark_url, config.project.hark_file)
-            sp.text += ui.dim(hark_hash)
-            sp.ok(ui.TICK)
+        uploads.append(("Hark", package.hark_url, config.project.hark_file))
     if package.new_config:
-        with ui.spin("Updating configuration ") as sp:
-            instance_api.upload_file(package.config_url, config.config_file)
-            sp.text += ui.dim(config_hash)
+        uploads.append(("Config", package.config_url, config.config_file))
+
+    if uploads:
+        # Create the (lru_cached) S3 client before the threads start -
+        # concurrent boto3 client construction is not thread-safe
+        aws.get_client("s3")
+        names = ", ".join(name for name, _, _ in uploads)
+        with ui.spin(f"Uploading: {names} ") as sp:
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                futures = [
+                    ex.submit(instance_api.upload_file, url, path)
+                    for _, url, path in uploads
+                ]
+                for future in futures:
+                    future.result()  # surface upload errors here
             sp.ok(ui.TICK)
 
     # 5. Create a deployment
@@ -103,6 +115,7 @@ def deploy(config: Config, instance_api):
         q.switch(instance.id, deployment.id)
 
         start = time.time()
+        delay = 0.3
         while True:
             if time.time() - start > 120:
                 raise HarkCloudTookTooLong("Waiting for deployment to complete")
@@ -117,7 +130,10 @@ def deploy(config: Config, instance_api):
                 info = ui.dim(f"waiting")
 
             sp.text = f"Deploying {config.instance_name}... {info}"
-            time.sleep(0.5)
+            # Exponential backoff (capped): fast deploys still get a quick
+            # first poll, slow ones stop hammering the API
+            delay = min(delay * 1.5, 5.0)
+            time.sleep(delay)
 
         sp.ok(ui.TICK)
 
@@ -129,8 +145,9 @@ def destroy(config: Config, instance_api):
         instance = instance_api.hosted_instance_state
         q.destroy(instance.id)
 
-        # And poll
+        # And poll, backing off as above
         start = time.time()
+        delay = 0.3
         while True:
             if time.time() - start > 120:
                 raise HarkCloudTookTooLong("Waiting for destroy to complete")
@@ -139,6 +156,7 @@ def destroy(config: Config, instance_api):
             if not ready:
                 break  # Done
 
-            time.sleep(0.5)
+            delay = min(delay * 1.5, 5.0)
+            time.sleep(delay)
 
         sp.ok(ui.TICK)
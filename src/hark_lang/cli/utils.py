@@ -1,4 +1,5 @@
 """CLI related utilities"""
+import hashlib
 import logging
 import os
 import shutil
@@ -46,15 +47,48 @@ def get_session_id(args, cfg: Config, required=True):
     return session_id
 
 
-def zip_dir(dirname: Path, dest: Path, deterministic=True):
-    """Zip a directory"""
+class HashingWriter:
+    """File-like wrapper that SHA256-hashes everything written through it
+
+    Lets the zip digest be computed while the zip is built, instead of
+    re-reading the whole file afterwards.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self._hash = hashlib.sha256()
+
+    def write(self, data):
+        self._hash.update(data)
+        return self._f.write(data)
+
+    def flush(self):
+        self._f.flush()
+
+    def tell(self):
+        return self._f.tell()
+
+    def seekable(self):
+        # Writes must stay strictly sequential for the hash to match the
+        # file, so keep zipfile in its streaming (non-seeking) mode
+        return False
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def zip_dir(dirname: Path, dest: Path, deterministic=True) -> str:
+    """Zip a directory, returning the zip's SHA256 hex digest"""
     # https://github.com/bboe/deterministic_zip/blob/master/deterministic_zip/__init__.py
-    with zipfile.ZipFile(dest, "w") as zip_file:
-        dz.add_directory(zip_file, dirname, dirname.name)
+    with open(dest, "wb") as f:
+        writer = HashingWriter(f)
+        with zipfile.ZipFile(writer, "w") as zip_file:
+            dz.add_directory(zip_file, dirname, dirname.name)
+    return writer.hexdigest()
 
 
-def make_python_layer_zip(config: Config, dest: Path):
-    """Create the python code layer Zip, saving it in dest"""
+def make_python_layer_zip(config: Config, dest: Path) -> str:
+    """Create the python code layer Zip in dest, returning its SHA256 digest"""
     root = Path(__file__).parents[3]
 
     if not config.project.python_src.exists():
@@ -88,7 +122,7 @@ def make_python_layer_zip(config: Config, dest: Path):
     with open(workdir / ".packaged_by_hark.txt", "w") as f:
         f.write("Packed by Hark :)")
 
-    zip_dir(workdir, dest)
+    return zip_dir(workdir, dest)
 
 
 def get_layer_zip_path(config: Config) -> Path:
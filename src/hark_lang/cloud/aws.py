@@ -1,6 +1,7 @@
 """Manage Hark deployments in AWS"""
 
 import base64
+import hashlib
 import json
 import logging
 import os
@@ -89,7 +90,14 @@ def get_region():
 def hash_file(filename: Path) -> str:
     """Get the hex digest SHA256 hash of a file"""
     with open(filename, "rb") as f:
-        return sha256(f.read()).hexdigest()
+        try:
+            # Python 3.11+: hashes with a big reused buffer, entirely in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        except AttributeError:
+            digest = sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
 
 
 def to_hexdigest(aws_hash: str):
@@ -1,6 +1,7 @@
 import os
 import logging
 from ast import literal_eval
+from bisect import bisect_right
 from itertools import chain
 from pathlib import Path
 from typing import Any
@@ -90,8 +91,10 @@ class HarkLexer(Lexer):
     def NL(self, t):
         self.lineno = t.lineno + t.value.count("\n")
 
-    # Identifiers and keywords
-    ID = "[a-z_][a-zA-Z0-9_?.]*"
+    # Identifiers and keywords. (?a:...) restricts the character classes to
+    # ASCII so the regex engine skips Unicode property lookups - lexing
+    # dominates cold-start parse time and this is per-character work.
+    ID = r"(?a:[a-z_][a-zA-Z0-9_?.]*)"
     ID["fn"] = FN
     ID["lambda"] = LAMBDA
     ID["if"] = IF
@@ -102,10 +105,10 @@ class HarkLexer(Lexer):
     ID["false"] = FALSE
     ID["null"] = NULL
 
-    SYMBOL = r":[a-z][a-zA-Z0-9_]*"
+    SYMBOL = r"(?a::[a-z][a-zA-Z0-9_]*)"
 
     # values
-    NUMBER = r"[+-]?[\d]+[\d.]*"
+    NUMBER = r"(?a:[+-]?[\d]+[\d.]*)"
     STRING = r'"(?:[^"\\]|\\.)*"'
     SQ_STRING = r"'(?:[^'\\]|\\.)*'"
 
@@ -129,11 +132,17 @@ class HarkLexer(Lexer):
         )
 
 
+# The shared terminator token yielded by post_lex. Its position fields are
+# updated as the stream advances, so one instance is enough (parsing is
+# synchronous), and it saves rebuilding the sentinel on every parse.
+_TERM = Token()
+_TERM.value = ";"
+_TERM.type = "TERM"
+
+
 def post_lex(toks):
     """Tweak the token stream to simplify the grammar"""
-    term = Token()
-    term.value = ";"
-    term.type = "TERM"
+    term = _TERM
 
     try:
         t = next(toks)
@@ -174,9 +183,16 @@ def post_lex(toks):
 def N(parser, parse_item, node_cls: n.Node, *args):
     """Factory for nodes with source text line and column information"""
     try:
-        lineno = parser.source_text[: parse_item.index].count("\n") + 1
-        line = parser.source_text.split("\n")[lineno - 1]
-        column = index_column(parser.source_text, parse_item.index)
+        index = parse_item.index
+        # Find the line with a binary search over the precomputed line-start
+        # offsets - counting newlines from the top for every node made
+        # parsing quadratic in the source size
+        starts = parser.line_starts
+        lineno = bisect_right(starts, index)
+        start = starts[lineno - 1]
+        end = starts[lineno] - 1 if lineno < len(starts) else None
+        line = parser.source_text[start:end]
+        column = index_column(parser.source_text, index)
     except AttributeError:
         lineno = None
         line = None
@@ -192,7 +208,13 @@ class HarkParser(Parser):
     def __init__(self, filename, source_text):
         super().__init__()
         self.filename = filename
+        self.set_source_text(source_text)
+
+    def set_source_text(self, source_text):
         self.source_text = source_text
+        self.line_starts = [0] + [
+            i + 1 for i, c in enumerate(source_text) if c == "\n"
+        ]
 
     tokens = HarkLexer.tokens
     precedence = (
@@ -263,17 +285,28 @@ class HarkParser(Parser):
     def expr(self, p):
         return N(self, p, n.N_Lambda, p.paramlist, p.block_expr)
 
+    # NOTE: the list-like rules (paramlist, arglist, list_items, hash_items)
+    # are left-recursive: each reduction appends to the accumulated list
+    # in-place, which is O(N) overall and keeps the parser stack shallow.
+    # Right recursion would copy the tail on every step (O(N^2)) and grow
+    # the stack to the length of the list. A trailing comma stays legal.
+
     @_("nothing")
     def paramlist(self, p):
         return []
 
-    @_("ID")
+    @_("params", "params ','")
     def paramlist(self, p):
+        return p.params
+
+    @_("ID")
+    def params(self, p):
         return [p.ID]
 
-    @_("ID ',' paramlist")
-    def paramlist(self, p):
-        return [p.ID] + p.paramlist
+    @_("params ',' ID")
+    def params(self, p):
+        p.params.append(p.ID)
+        return p.params
 
     @_("'{' expressions '}'")
     def block_expr(self, p):
@@ -297,13 +330,18 @@ class HarkParser(Parser):
     def arglist(self, p):
         return []
 
-    @_("arg_item")
+    @_("args", "args ','")
     def arglist(self, p):
+        return p.args
+
+    @_("arg_item")
+    def args(self, p):
         return [p.arg_item]
 
-    @_("arg_item ',' arglist")
-    def arglist(self, p):
-        return [p.arg_item] + p.arglist
+    @_("args ',' arg_item")
+    def args(self, p):
+        p.args.append(p.arg_item)
+        return p.args
 
     @_("expr")
     def arg_item(self, p):
@@ -386,13 +424,18 @@ class HarkParser(Parser):
     def list_items(self, p):
         return []
 
-    @_("expr")
+    @_("items", "items ','")
     def list_items(self, p):
+        return p.items
+
+    @_("expr")
+    def items(self, p):
         return [p.expr]
 
-    @_("expr ',' list_items")
-    def list_items(self, p):
-        return [p.expr] + p.list_items
+    @_("items ',' expr")
+    def items(self, p):
+        p.items.append(p.expr)
+        return p.items
 
     @_("'{' hash_items TERM '}' TERM")
     def expr(self, p):
@@ -403,13 +446,18 @@ class HarkParser(Parser):
     def hash_items(self, p):
         return []
 
-    @_("expr ':' expr")
+    @_("pairs", "pairs ','")
     def hash_items(self, p):
+        return p.pairs
+
+    @_("expr ':' expr")
+    def pairs(self, p):
         return [p[0], p[2]]
 
-    @_("expr ':' expr ',' hash_items")
-    def hash_items(self, p):
-        return [p[0], p[2]] + p.hash_items
+    @_("pairs ',' expr ':' expr")
+    def pairs(self, p):
+        p.pairs.extend((p[2], p[4]))
+        return p.pairs
 
     # literals
 
@@ -435,11 +483,17 @@ class HarkParser(Parser):
 
     @_("NUMBER")
     def expr(self, p):
-        return N(self, p, n.N_Literal, literal_eval(p.NUMBER))
+        # The lexer guarantees a numeric token - int()/float() are much
+        # cheaper than parsing a whole AST with literal_eval
+        value = float(p.NUMBER) if "." in p.NUMBER else int(p.NUMBER)
+        return N(self, p, n.N_Literal, value)
 
     @_("STRING", "SQ_STRING")
     def expr(self, p):
-        return N(self, p, n.N_Literal, literal_eval(p[0]))
+        # Only strings with escape sequences need literal_eval; the common
+        # case is just the token minus its quotes
+        value = p[0][1:-1] if "\\" not in p[0] else literal_eval(p[0])
+        return N(self, p, n.N_Literal, value)
 
     def error(self, p):
         raise HarkParseError(
@@ -450,10 +504,30 @@ class HarkParser(Parser):
 ###
 
 
+# sly builds its regex and parse tables at class level, but instantiation
+# still has a cost. The instances are stateless apart from the fields set
+# below, so create them once and reuse them for every parse.
+_LEXER = None
+_PARSER = None
+
+
+def _lexer_parser(filename, source_text):
+    global _LEXER, _PARSER
+    if _LEXER is None:
+        _LEXER = HarkLexer(filename, source_text)
+        _PARSER = HarkParser(filename, source_text)
+    else:
+        _LEXER.filename = filename
+        _LEXER.source_text = source_text
+        _LEXER.lineno = 1  # tokenize() does not reset it
+        _PARSER.filename = filename
+        _PARSER.set_source_text(source_text)
+    return _LEXER, _PARSER
+
+
 def tl_parse(filename: str, text: str, debug_lex=False):
     filename = str(Path(filename).absolute().resolve())
-    parser = HarkParser(filename, text)
-    lexer = HarkLexer(filename, text)
+    lexer, parser = _lexer_parser(filename, text)
     if debug_lex:
         toks = list(post_lex(lexer.tokenize(text)))
         indent = 0
@@ -32,6 +32,20 @@ class Instruction:
     num_ops = None
     op_types = None
     check_op_types = True
+    name = "Instruction"
+
+    def __init_subclass__(cls, **kwargs):
+        # The name is a property of the class, not the instance - compute it
+        # once per subclass rather than on every construction
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+        # Likewise, resolve the operand checks (callable vs isinstance) once
+        # per subclass instead of branching per operand per construction
+        if cls.op_types:
+            cls._op_checks = tuple(
+                callable if t is callable else (lambda a, t=t: isinstance(a, t))
+                for t in cls.op_types
+            )
 
     @classmethod
     def from_node(cls, ast_node, *operands):
@@ -44,7 +58,6 @@ class Instruction:
         return cls(*operands, source=source)
 
     def __init__(self, *operands, source: list = None):
-        self.name = type(self).__name__
         self.source = source or [None, None, None, None]
 
         # All operands *must* be TlType so that the instruction can be
@@ -58,17 +71,19 @@ class Instruction:
                 raise BadOperandsLength(self.name, len(operands), self.num_ops)
 
         if self.op_types:
-            for idx, (a, b) in enumerate(zip(operands, self.op_types)):
-                ok = callable(a) if b == callable else isinstance(a, b)
-                if not ok:
-                    raise BadOperandsType(self.name, type(a), b, idx)
+            for idx, (a, check) in enumerate(zip(operands, self._op_checks)):
+                if not check(a):
+                    raise BadOperandsType(self.name, type(a), self.op_types[idx], idx)
 
         self.operands = operands
 
+        # Operands are TlType (immutable once validated), so the serialised
+        # form can be computed once here instead of on every serialise() call
+        self._serialised = [self.name, [o.serialise() for o in operands], self.source]
+
     def serialise(self) -> list:
         """Serialise"""
-        operands = [o.serialise() for o in self.operands]
-        return [self.name, operands, self.source]
+        return self._serialised
 
     @classmethod
     def deserialise(cls, obj: list, instruction_set):